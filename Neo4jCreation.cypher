@@ -1,9 +1,20 @@
+// Create uniqueness constraints (each one is backed by an index on name).
+// The script only MERGEs below, so it can be re-run. On a database seeded by an older
+// version of this script, the constraints fail to create while duplicate nodes exist;
+// find them per label with the query below, remove the duplicates, then re-run the script:
+//   MATCH (n:Muscle) WITH n.name AS name, count(*) AS copies WHERE copies > 1 RETURN name, copies;
+CREATE CONSTRAINT muscle_name IF NOT EXISTS FOR (m:Muscle) REQUIRE m.name IS UNIQUE;
+CREATE CONSTRAINT exercise_name IF NOT EXISTS FOR (e:Exercise) REQUIRE e.name IS UNIQUE;
+CREATE CONSTRAINT requirement_name IF NOT EXISTS FOR (r:Requirement) REQUIRE r.name IS UNIQUE;
+CREATE CONSTRAINT distribution_name IF NOT EXISTS FOR (d:Distribution) REQUIRE d.name IS UNIQUE;
+CREATE CONSTRAINT group_name IF NOT EXISTS FOR (g:Group) REQUIRE g.name IS UNIQUE;
+
 // Create Muscle nodes
 UNWIND [
     "quads", "hams", "glutes", "chest", "back", "delts", "rear delts", "front delts",
     "biceps", "triceps", "traps", "calves", "abs", "forearms", "abductor"
 ] AS muscle
-CREATE (:Muscle {name: muscle});
+MERGE (:Muscle {name: muscle});
 
 // Create Exercise nodes
 UNWIND [
@@ -17,19 +28,19 @@ UNWIND [
     "seated calf raise", "hang clean", "abductor side lift", "abductor squat", "dumbbell abductor lunge",
     "standing abductor raise"
 ] AS exercise
-CREATE (:Exercise {name: exercise});
+MERGE (:Exercise {name: exercise});
 
 // Create requirement nodes
 UNWIND [
     "none", "dumbbells", "barbell", "machine", "cable", "smith machine"
 ] AS requirement
-CREATE (:Requirement {name: requirement});
+MERGE (:Requirement {name: requirement});
 
 // Create distribution nodes
 UNWIND [
     "push, pull, legs", "arnold split", "bro split", "full body"
 ] AS distribution
-CREATE (:Distribution {name: distribution});
+MERGE (:Distribution {name: distribution});
 
 // Create group nodes
 UNWIND [
@@ -47,7 +58,7 @@ UNWIND [
     {group: "full body", muscles: ["quads", "hams", "glutes", "chest", "back", "delts", "rear delts", "front delts",
     "biceps", "triceps", "traps", "calves", "abs", "forearms", "abductor"]}
 ] AS groupData
-CREATE (g:Group {name: groupData.group})
+MERGE (g:Group {name: groupData.group})
 WITH g, groupData.muscles AS muscles
 UNWIND muscles AS muscle
 MATCH (m:Muscle {name: muscle})
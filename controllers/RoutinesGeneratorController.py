@@ -4,6 +4,11 @@ from factories.Neo4jRepositoryFactory import Neo4jRepositoryFactory
 from services.RoutineGeneratorService import RoutineGenerator
 from factories.CouchdbRepositoryFactory import CouchdbRepositoryFactory
 from services.AuthService import authenticate_user
+from services.RoutineCacheService import RoutineCache
+from services.RoutineChangesConsumer import RoutineChangesConsumer
+from repositories.RoutinesRepository import RoutinesRepository
+import socket
+import os
 
 router = APIRouter()
 
@@ -18,6 +23,16 @@ routine_generator = RoutineGenerator(repository_factory, neo4j_repository_factor
 exercises_repository = neo4j_repository_factory.create_exercises_repository()
 routines_repository = couchdb_repository_factory.create_routines_repository()
 
+# Per-worker routine cache, kept fresh by the CouchDB changes feed (started in main.py).
+# The checkpoint is shared by the workers of a host; set COUCHDB_CHANGES_CONSUMER_ID to override.
+routines_cache = RoutineCache(ttl_seconds=float(os.getenv("ROUTINE_CACHE_TTL", "3600")))
+routines_changes_consumer = RoutineChangesConsumer(
+    couchdb_repository_factory.config,
+    RoutinesRepository.DB_NAME,
+    routines_cache,
+    os.getenv("COUCHDB_CHANGES_CONSUMER_ID", f"routine-cache-{socket.gethostname()}")
+)
+
 
 @router.get("/")
 async def root():
@@ -31,8 +46,16 @@ async def get_routines(user_id: int = Depends(authenticate_user)):
 
     :param user_id: The user ID.
     """
+    # The cache is only trusted while the changes feed is running and caught up
+    use_cache = routines_changes_consumer.is_healthy()
+    if use_cache:
+        routines = routines_cache.get(user_id)
+        if routines:
+            return routines
     routines = routines_repository.get_routines_by_user_id(user_id)
     if routines:
+        if use_cache:
+            routines_cache.set(user_id, routines)
         return routines
     raise HTTPException(status_code=404, detail=f"No routines found for user {user_id}.")
 
@@ -60,6 +83,7 @@ async def generate_and_save_routine(distribution_name: str, user_id: int = Depen
             "routines": routines
         }
         response = routines_repository.save_routine(user_id, routine_data)
+        routines_cache.evict(user_id)
         return routine_data
 
     except ValueError as error:
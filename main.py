@@ -1,5 +1,5 @@
 from fastapi import FastAPI
-from controllers.RoutinesGeneratorController import router
+from controllers.RoutinesGeneratorController import router, routines_changes_consumer
 from factories.PostgresConnectionFactory import PostgresConnectionFactory
 
 app = FastAPI()
@@ -15,3 +15,12 @@ async def startup_event():
     """
     connection_factory = PostgresConnectionFactory()
     connection_factory.initialize_database()
+    routines_changes_consumer.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Stops following the routines changes feed.
+    """
+    routines_changes_consumer.stop()
@@ -6,6 +6,39 @@ class ExercisesRepository:
     Repository for interacting with Neo4j to fetch exercise, muscle, and group data.
     """
 
+    EXERCISES_BY_MUSCLE_QUERY = """
+        MATCH (m:Muscle {name: $muscle_name})<-[:WORKS_DIRECTLY]-(e:Exercise)
+        RETURN e.name AS exercise_name
+    """
+
+    MUSCLES_BY_GROUP_QUERY = """
+        MATCH (g:Group {name: $group_name})-[:INCLUDES]->(m:Muscle)
+        RETURN m.name AS muscles
+    """
+
+    GROUPS_BY_DISTRIBUTION_QUERY = """
+        MATCH (d:Distribution {name: $distribution_name})-[:USES]->(g:Group)
+        RETURN g.name AS groups
+    """
+
+    EXERCISES_BY_MUSCLES_QUERY = """
+        UNWIND $names AS muscle_name
+        MATCH (m:Muscle {name: muscle_name})<-[:WORKS_DIRECTLY]-(e:Exercise)
+        RETURN m.name AS name, collect(e.name) AS values
+    """
+
+    MUSCLES_BY_GROUPS_QUERY = """
+        UNWIND $names AS group_name
+        MATCH (g:Group {name: group_name})-[:INCLUDES]->(m:Muscle)
+        RETURN g.name AS name, collect(m.name) AS values
+    """
+
+    GROUPS_BY_DISTRIBUTIONS_QUERY = """
+        UNWIND $names AS distribution_name
+        MATCH (d:Distribution {name: distribution_name})-[:USES]->(g:Group)
+        RETURN d.name AS name, collect(g.name) AS values
+    """
+
     def __init__(self, driver: GraphDatabase.driver):
         """
         Initialize with a Neo4j driver.
@@ -22,11 +55,7 @@ class ExercisesRepository:
         :return: A list of exercises related to the muscle.
         """
         with self.driver.session() as session:
-            query = """
-                MATCH (m:Muscle {name: $muscle_name})-[:WORKS_DIRECTLY]-(e:Exercise)
-                RETURN e.name AS exercise_name
-            """
-            result = session.run(query, muscle_name=muscle_name)
+            result = session.run(self.EXERCISES_BY_MUSCLE_QUERY, muscle_name=muscle_name)
             exercises = [record["exercise_name"] for record in result]
             return exercises
 
@@ -38,11 +67,7 @@ class ExercisesRepository:
         :return: A list of muscles associated with the group.
         """
         with self.driver.session() as session:
-            query = """
-                MATCH (g:Group {name: $group_name})-[:INCLUDES]->(m:Muscle)
-                RETURN m.name AS muscles
-            """
-            result = session.run(query, group_name=group_name)
+            result = session.run(self.MUSCLES_BY_GROUP_QUERY, group_name=group_name)
             muscles_by_group = [record["muscles"] for record in result]
             return muscles_by_group
 
@@ -54,10 +79,49 @@ class ExercisesRepository:
         :return: A list of groups associated with the distribution.
         """
         with self.driver.session() as session:
-            query = """
-                MATCH (d:Distribution {name: $distribution_name})-[:USES]->(g:Group)
-                RETURN g.name AS groups
-            """
-            result = session.run(query, distribution_name=distribution_name)
+            result = session.run(self.GROUPS_BY_DISTRIBUTION_QUERY, distribution_name=distribution_name)
             groups_by_distribution = [record["groups"] for record in result]
             return groups_by_distribution
+
+    def get_exercises_by_muscles(self, muscle_names: list):
+        """
+        Retrieves exercises for several muscles in a single round trip.
+
+        :param muscle_names: The names of the muscles (e.g., ['chest', 'triceps']).
+        :return: A dictionary mapping each muscle name to its list of exercises.
+        """
+        return self._run_batch(self.EXERCISES_BY_MUSCLES_QUERY, muscle_names)
+
+    def get_muscles_by_groups(self, group_names: list):
+        """
+        Retrieves the muscles for several groups in a single round trip.
+
+        :param group_names: The names of the groups (e.g., ['push', 'pull']).
+        :return: A dictionary mapping each group name to its list of muscles.
+        """
+        return self._run_batch(self.MUSCLES_BY_GROUPS_QUERY, group_names)
+
+    def get_groups_by_distributions(self, distribution_names: list):
+        """
+        Retrieves the groups for several distributions in a single round trip.
+
+        :param distribution_names: The names of the distributions (e.g., ['bro split']).
+        :return: A dictionary mapping each distribution name to its list of groups.
+        """
+        return self._run_batch(self.GROUPS_BY_DISTRIBUTIONS_QUERY, distribution_names)
+
+    def _run_batch(self, query: str, names: list):
+        """
+        Runs an UNWIND query and groups its rows by the requested name.
+        Names without matches are returned with an empty list.
+
+        :param query: A query taking a $names list and returning name/values rows.
+        :param names: The names to look up.
+        :return: A dictionary mapping each name to its list of values.
+        """
+        results = {name: [] for name in names}
+        with self.driver.session() as session:
+            result = session.run(query, names=list(results))
+            for record in result:
+                results[record["name"]] = record["values"]
+        return results
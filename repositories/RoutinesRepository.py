@@ -3,6 +3,8 @@ class RoutinesRepository:
     Repository for routines stored in CouchDB.
     """
 
+    DB_NAME = "ptrainer_user_routine"  # Name of the database for routines
+
     def __init__(self, server):
         """
         Initializes the repository with a CouchDB server.
@@ -10,7 +12,7 @@ class RoutinesRepository:
         :param server: The CouchDB server instance.
         """
         self.server = server
-        self.db_name = "ptrainer_user_routine"  # Name of the database for routines
+        self.db_name = self.DB_NAME
         self._ensure_database_exists()
 
     def _ensure_database_exists(self):
@@ -0,0 +1,123 @@
+import threading
+import time
+
+
+class RoutineCache:
+    """
+    In-process cache of user routines with a time-to-live per entry.
+    Each API worker holds its own instance, kept fresh by the CouchDB changes feed.
+
+    The cache also remembers the latest revision the changes feed has reported for
+    each user, so a read that fetched an older revision can never be stored.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        """
+        Initialize an empty cache.
+
+        :param ttl_seconds: How long an entry (and a seen revision) is kept.
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}
+        self._seen_revisions = {}
+        self._next_prune = time.monotonic() + ttl_seconds
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def revision_generation(rev):
+        """
+        Returns the generation number of a CouchDB revision (the N in "N-hash").
+
+        :param rev: The revision string, or None.
+        :return: The generation, or 0 if the revision is missing or malformed.
+        """
+        try:
+            return int(str(rev).split("-", 1)[0])
+        except ValueError:
+            return 0
+
+    def get(self, user_id):
+        """
+        Returns the cached routine for a user, or None if missing or expired.
+
+        :param user_id: The ID of the user.
+        """
+        key = str(user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, routine = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return routine
+
+    def set(self, user_id, routine):
+        """
+        Stores a routine for a user, restarting its TTL. The routine is refused if
+        the changes feed has already reported a newer revision for the user.
+
+        :param user_id: The ID of the user.
+        :param routine: The routine document to cache.
+        :return: True if the routine was stored.
+        """
+        key = str(user_id)
+        generation = self.revision_generation(routine.get("_rev"))
+        now = time.monotonic()
+        with self._lock:
+            self._prune_expired(now)
+            seen = self._seen_revisions.get(key)
+            if seen is not None and seen[0] >= now and generation < seen[1]:
+                return False
+            self._entries[key] = (now + self.ttl_seconds, routine)
+            return True
+
+    def apply_change(self, user_id, rev, routine=None):
+        """
+        Records a revision reported by the changes feed. A cached routine is
+        replaced by `routine`, or evicted if `routine` is None (e.g. a deletion).
+        Users that are not cached are not added.
+
+        :param user_id: The ID of the user.
+        :param rev: The revision reported by the feed.
+        :param routine: The routine document at that revision, if available.
+        """
+        key = str(user_id)
+        generation = self.revision_generation(rev)
+        now = time.monotonic()
+        with self._lock:
+            self._prune_expired(now)
+            seen = self._seen_revisions.get(key)
+            if seen is None or seen[0] < now or generation >= seen[1]:
+                self._seen_revisions[key] = (now + self.ttl_seconds, generation)
+
+            if key not in self._entries:
+                return
+            if routine is None:
+                del self._entries[key]
+            elif self.revision_generation(self._entries[key][1].get("_rev")) <= generation:
+                self._entries[key] = (now + self.ttl_seconds, routine)
+
+    def _prune_expired(self, now: float):
+        """
+        Drops expired routines and seen revisions, at most once per TTL.
+        Must be called with the lock held.
+
+        :param now: The current time.monotonic() value.
+        """
+        if now < self._next_prune:
+            return
+        self._entries = {key: entry for key, entry in self._entries.items() if entry[0] >= now}
+        self._seen_revisions = {key: seen for key, seen in self._seen_revisions.items() if seen[0] >= now}
+        self._next_prune = now + self.ttl_seconds
+
+    def evict(self, user_id):
+        """
+        Removes the cached routine for a user.
+
+        :param user_id: The ID of the user.
+        :return: True if an entry was removed.
+        """
+        with self._lock:
+            return self._entries.pop(str(user_id), None) is not None
@@ -0,0 +1,190 @@
+import threading
+import time
+from couchdb2 import RevisionError
+from config.CouchdbConfig import CouchdbConfig
+from services.RoutineCacheService import RoutineCache
+
+
+class RoutineChangesConsumer:
+    """
+    Background consumer of the routines database's CouchDB _changes feed.
+    Refreshes or evicts cached routines whenever their document changes, no matter
+    which worker or service wrote it.
+
+    The cache of a worker starts empty, so the feed is always followed from the
+    current update sequence (since=now). The position reached is checkpointed in a
+    _local document shared by the workers of a host, which records how far that
+    host has processed the feed; it is not a resume point. Workers only move it
+    forward, and at most once per `checkpoint_interval`.
+    """
+
+    def __init__(self, config: CouchdbConfig, db_name: str, cache: RoutineCache, consumer_id: str,
+                 poll_timeout: int = 30, batch_limit: int = 500, retry_delay: int = 5,
+                 checkpoint_interval: int = 60):
+        """
+        Initialize the consumer for a CouchDB database.
+
+        :param config: The shared CouchDB configuration holding the server connection.
+        :param db_name: The database whose changes are followed.
+        :param cache: The cache kept in sync with the database.
+        :param consumer_id: Name of the _local document holding the checkpoint.
+        :param poll_timeout: Seconds each longpoll request waits for changes.
+        :param batch_limit: Maximum number of changes fetched per request.
+        :param retry_delay: Seconds to wait before retrying after an error.
+        :param checkpoint_interval: Minimum seconds between checkpoint writes.
+        """
+        self.config = config
+        self.db_name = db_name
+        self.checkpoint_id = f"_local/{consumer_id}"
+        self.cache = cache
+        self.poll_timeout = poll_timeout
+        self.batch_limit = batch_limit
+        self.retry_delay = retry_delay
+        self.checkpoint_interval = checkpoint_interval
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._last_caught_up = None
+        self._checkpointed_seq = None
+        self._next_checkpoint = 0.0
+
+    def start(self):
+        """
+        Starts following the changes feed in a daemon thread.
+        """
+        if self.config.server is None:
+            print("No connection to the CouchDB server, routine changes feed not started.")
+            return
+        if self._thread is not None and self._thread.is_alive() and not self._stop_event.is_set():
+            return
+        # A fresh event per run, so a thread left in a longpoll by stop() still exits
+        self._stop_event = threading.Event()
+        self._last_caught_up = None
+        self._thread = threading.Thread(target=self._run, args=(self._stop_event,),
+                                        name="routine-changes-consumer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the consumer; an in-flight longpoll request is abandoned.
+        """
+        self._stop_event.set()
+        self._last_caught_up = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def is_healthy(self):
+        """
+        Tells whether the cache can be trusted: the consumer is running and has been
+        caught up with the feed within the last two poll timeouts.
+
+        :return: True if cached routines are known to be fresh.
+        """
+        last_caught_up = self._last_caught_up
+        if self._thread is None or not self._thread.is_alive() or last_caught_up is None:
+            return False
+        return time.monotonic() - last_caught_up <= 2 * self.poll_timeout
+
+    def _run(self, stop_event: threading.Event):
+        """
+        Follows the changes feed until stopped, retrying after errors.
+
+        :param stop_event: The event that stops this run.
+        """
+        since = None
+        while not stop_event.is_set():
+            try:
+                db = self.config.server[self.db_name]
+                if since is None:
+                    since = db.get_info()["update_seq"]
+                    self._last_caught_up = time.monotonic()
+                since = self._poll(db, since)
+            except Exception as e:
+                print(f"Error following routine changes feed: {e}")
+                stop_event.wait(self.retry_delay)
+
+    def _poll(self, db, since):
+        """
+        Fetches and applies one page of changes. Pages are capped at `batch_limit`,
+        so a backlog is drained over several requests rather than loaded in one response.
+
+        :param db: The couchdb2 Database to follow.
+        :param since: The sequence to read changes after.
+        :return: The sequence to continue from.
+        """
+        body = db.changes(feed="longpoll", since=since, limit=self.batch_limit,
+                          include_docs=True, timeout=self.poll_timeout * 1000)
+        results = body.get("results", [])
+        for change in results:
+            self._apply_change(change)
+
+        pending = body.get("pending", 0 if len(results) < self.batch_limit else 1)
+        if not pending:
+            self._last_caught_up = time.monotonic()
+
+        last_seq = body.get("last_seq", since)
+        self._maybe_checkpoint(db, last_seq)
+        return last_seq
+
+    def _apply_change(self, change: dict):
+        """
+        Passes a change to the cache: deletions evict, updates refresh cached users.
+
+        :param change: A single entry of the changes feed results.
+        """
+        user_id = change.get("id", "")
+        if user_id.startswith("_design/"):
+            return
+        revs = change.get("changes") or [{}]
+        doc = None if change.get("deleted") else change.get("doc")
+        self.cache.apply_change(user_id, revs[0].get("rev"), doc)
+
+    @staticmethod
+    def sequence_number(seq):
+        """
+        Returns the numeric prefix of an update sequence ("N-opaque" or a plain integer).
+
+        :param seq: The update sequence.
+        :return: The number, or 0 if the sequence has no numeric prefix.
+        """
+        try:
+            return int(str(seq).split("-", 1)[0])
+        except ValueError:
+            return 0
+
+    def _maybe_checkpoint(self, db, last_seq):
+        """
+        Stores the position reached if the interval has elapsed and it moved forward.
+
+        :param db: The couchdb2 Database to follow.
+        :param last_seq: The sequence reached.
+        """
+        now = time.monotonic()
+        if now < self._next_checkpoint:
+            return
+        self._next_checkpoint = now + self.checkpoint_interval
+        if self._checkpointed_seq is not None and \
+                self.sequence_number(last_seq) <= self.sequence_number(self._checkpointed_seq):
+            return
+        self._save_checkpoint(db, last_seq)
+
+    def _save_checkpoint(self, db, last_seq):
+        """
+        Stores the position reached in the checkpoint document, unless another
+        worker of the host has already stored a later one.
+
+        :param db: The couchdb2 Database to follow.
+        :param last_seq: The sequence reached.
+        """
+        checkpoint = {"_id": self.checkpoint_id, "last_seq": last_seq}
+        existing = db.get(self.checkpoint_id)
+        if existing:
+            if self.sequence_number(existing.get("last_seq")) >= self.sequence_number(last_seq):
+                self._checkpointed_seq = existing.get("last_seq")
+                return
+            checkpoint["_rev"] = existing["_rev"]
+        try:
+            db.put(checkpoint)
+            self._checkpointed_seq = last_seq
+        except RevisionError:
+            pass  # Another worker of this host saved it first; retried next interval
@@ -31,11 +31,17 @@ class RoutineGenerator:
         if not groups:
             raise ValueError(f"No groups found for distribution '{distribution_name}'.")
 
-        # Step 2: Generate routines for each group
+        # Step 2: Fetch the muscles of every group and the exercises of every muscle in two round trips
+        muscles_by_group = self.groups_repository.get_muscles_by_groups(groups)
+        distribution_muscles = dict.fromkeys(
+            muscle for group in groups for muscle in muscles_by_group[group]
+        )
+        exercises_by_muscle = self.groups_repository.get_exercises_by_muscles(list(distribution_muscles))
+
+        # Step 3: Generate routines for each group
         routines = []
         for group in groups:
-            # Fetch the muscles in the group
-            muscles = self.groups_repository.get_muscles_by_group(group_name=group)
+            muscles = muscles_by_group[group]
             if not muscles:
                 continue
 
@@ -50,7 +56,7 @@ class RoutineGenerator:
                 mev = volume_data["mev"]
 
                 # Get up to 4 exercises for the muscle
-                exercises = self.groups_repository.get_exercises_by_muscle(muscle_name=muscle)[:4]
+                exercises = exercises_by_muscle[muscle][:4]
                 if not exercises:
                     continue
 
@@ -0,0 +1,62 @@
+from services import RoutineCacheService
+from services.RoutineCacheService import RoutineCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(monkeypatch, ttl_seconds=60):
+    clock = FakeClock()
+    monkeypatch.setattr(RoutineCacheService.time, "monotonic", clock)
+    return RoutineCache(ttl_seconds), clock
+
+
+def test_stale_read_is_refused_after_feed_reports_newer_revision(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    # A GET read rev 1, then the feed reported rev 2 for a user that is not cached yet
+    cache.apply_change("7", "2-b", {"_rev": "2-b"})
+    assert cache.get("7") is None
+    assert cache.set("7", {"_rev": "1-a"}) is False
+    assert cache.get("7") is None
+    assert cache.set("7", {"_rev": "2-b"}) is True
+    assert cache.get("7")["_rev"] == "2-b"
+
+
+def test_apply_change_refreshes_cached_routine_but_never_goes_backwards(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    cache.set("7", {"_rev": "2-b"})
+    cache.apply_change("7", "3-c", {"_rev": "3-c"})
+    assert cache.get("7")["_rev"] == "3-c"
+    cache.apply_change("7", "2-b", {"_rev": "2-b"})
+    assert cache.get("7")["_rev"] == "3-c"
+
+
+def test_deletion_evicts_and_blocks_older_revisions(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    cache.set("7", {"_rev": "3-c"})
+    cache.apply_change("7", "4-d", None)
+    assert cache.get("7") is None
+    assert cache.set("7", {"_rev": "3-c"}) is False
+
+
+def test_entries_and_seen_revisions_expire_with_the_ttl(monkeypatch):
+    cache, clock = make_cache(monkeypatch, ttl_seconds=60)
+    cache.set("1", {"_rev": "1-a"})
+    cache.apply_change("2", "5-x", None)
+    clock.now += 61
+    assert cache.get("1") is None
+    assert cache.set("2", {"_rev": "1-a"}) is True
+
+
+def test_expired_entries_are_pruned_without_being_read_again(monkeypatch):
+    cache, clock = make_cache(monkeypatch, ttl_seconds=60)
+    for user_id in range(100):
+        cache.set(user_id, {"_rev": "1-a"})
+    clock.now += 61
+    cache.set("new", {"_rev": "1-a"})
+    assert list(cache._entries) == ["new"]
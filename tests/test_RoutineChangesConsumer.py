@@ -0,0 +1,158 @@
+from couchdb2 import RevisionError
+from services import RoutineChangesConsumer as consumer_module
+from services.RoutineCacheService import RoutineCache
+from services.RoutineChangesConsumer import RoutineChangesConsumer
+
+
+class FakeConfig:
+    server = None
+
+
+class FakeDatabase:
+    def __init__(self, pages):
+        self.pages = pages
+        self.docs = {}
+        self.changes_calls = []
+        self.puts = 0
+        self.conflict = False
+
+    def get(self, id):
+        return self.docs.get(id)
+
+    def get_info(self):
+        return {"update_seq": "10-now"}
+
+    def put(self, doc):
+        if self.conflict:
+            raise RevisionError("conflict")
+        self.puts += 1
+        doc["_rev"] = f"{self.puts}-x"
+        self.docs[doc["_id"]] = dict(doc)
+
+    def changes(self, **kwargs):
+        self.changes_calls.append(kwargs)
+        return self.pages.pop(0)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_consumer(monkeypatch, cache=None, **kwargs):
+    clock = FakeClock()
+    monkeypatch.setattr(consumer_module.time, "monotonic", clock)
+    consumer = RoutineChangesConsumer(FakeConfig(), "db", cache or RoutineCache(3600), "test", **kwargs)
+    return consumer, clock
+
+
+def test_changes_are_applied_to_the_cache(monkeypatch):
+    cache = RoutineCache(3600)
+    cache.set("1", {"_rev": "1-a"})
+    cache.set("2", {"_rev": "1-a"})
+    consumer, _ = make_consumer(monkeypatch, cache, batch_limit=2)
+    db = FakeDatabase([{
+        "results": [
+            {"id": "_design/x", "changes": [{"rev": "1-d"}]},
+            {"id": "1", "changes": [{"rev": "2-b"}], "doc": {"_id": "1", "_rev": "2-b"}},
+            {"id": "2", "changes": [{"rev": "2-b"}], "deleted": True, "doc": {"_id": "2", "_deleted": True}},
+            {"id": "3", "changes": [{"rev": "4-c"}], "doc": {"_id": "3", "_rev": "4-c"}},
+        ],
+        "last_seq": "12-a", "pending": 0,
+    }])
+    assert consumer._poll(db, "10-now") == "12-a"
+    assert db.changes_calls[0]["limit"] == 2
+    assert db.changes_calls[0]["since"] == "10-now"
+    assert cache.get("1")["_rev"] == "2-b"
+    assert cache.get("2") is None
+    assert cache.get("3") is None
+    assert cache.set("3", {"_rev": "3-b"}) is False
+
+
+def test_checkpoint_is_written_on_a_timer_and_only_forward(monkeypatch):
+    consumer, clock = make_consumer(monkeypatch, checkpoint_interval=60)
+    db = FakeDatabase([
+        {"results": [], "last_seq": "12-a", "pending": 0},
+        {"results": [], "last_seq": "13-a", "pending": 0},
+        {"results": [], "last_seq": "13-b", "pending": 0},
+        {"results": [], "last_seq": "14-a", "pending": 0},
+    ])
+    consumer._poll(db, "10-now")
+    assert db.docs["_local/test"]["last_seq"] == "12-a"
+    consumer._poll(db, "12-a")
+    assert db.puts == 1  # Interval not elapsed
+    clock.now += 61
+    consumer._poll(db, "13-a")
+    assert db.docs["_local/test"]["last_seq"] == "13-b"
+    # Another worker of the host already stored a later position
+    db.docs["_local/test"]["last_seq"] = "20-z"
+    clock.now += 61
+    consumer._poll(db, "13-b")
+    assert db.docs["_local/test"]["last_seq"] == "20-z"
+    assert db.puts == 2
+
+
+def test_checkpoint_conflict_is_ignored_and_since_advances(monkeypatch):
+    consumer, _ = make_consumer(monkeypatch)
+    db = FakeDatabase([{"results": [], "last_seq": "14-a", "pending": 0}])
+    db.conflict = True
+    assert consumer._poll(db, "13-a") == "14-a"
+
+
+def test_health_follows_the_feed(monkeypatch):
+    consumer, clock = make_consumer(monkeypatch, poll_timeout=30)
+    assert consumer.is_healthy() is False
+
+    class AliveThread:
+        def is_alive(self):
+            return True
+
+    consumer._thread = AliveThread()
+    db = FakeDatabase([
+        {"results": [], "last_seq": "12-a", "pending": 0},
+        {"results": [], "last_seq": "13-a", "pending": 5},
+    ])
+    consumer._poll(db, "10-now")
+    assert consumer.is_healthy() is True
+    clock.now += 61
+    consumer._poll(db, "12-a")  # Still draining a backlog
+    assert consumer.is_healthy() is False
+
+
+def test_start_without_server_leaves_consumer_unhealthy(monkeypatch):
+    consumer, _ = make_consumer(monkeypatch)
+    consumer.start()
+    assert consumer._thread is None
+    assert consumer.is_healthy() is False
+
+
+def test_restart_does_not_revive_a_thread_left_in_a_longpoll(monkeypatch):
+    consumer, _ = make_consumer(monkeypatch, retry_delay=0)
+    released = consumer_module.threading.Event()
+
+    class BlockingDatabase(FakeDatabase):
+        def changes(self, **kwargs):
+            released.wait(5)
+            return {"results": [], "last_seq": "11-a", "pending": 0}
+
+    class Server:
+        def __getitem__(self, name):
+            return BlockingDatabase([])
+
+    consumer.config.server = Server()
+    try:
+        consumer.start()
+        old_thread, old_event = consumer._thread, consumer._stop_event
+        consumer.stop()
+        consumer.start()
+        assert old_event.is_set()
+        assert consumer._stop_event is not old_event
+        released.set()
+        old_thread.join(2)
+        assert not old_thread.is_alive()
+    finally:
+        consumer.stop()
+        consumer.config.server = None
@@ -0,0 +1,99 @@
+import argparse
+import sys
+
+from config.Neo4jConfig import Neo4jConfig
+from repositories.ExercisesRepository import ExercisesRepository
+
+# Operators that mean a lookup fell back to scanning a label, an index or a relationship type
+SCAN_OPERATORS = (
+    "AllNodesScan",
+    "NodeByLabelScan",
+    "NodeIndexScan",
+    "NodeIndexContainsScan",
+    "NodeIndexEndsWithScan",
+    "DirectedRelationshipTypeScan",
+    "UndirectedRelationshipTypeScan",
+    "DirectedAllRelationshipsScan",
+    "UndirectedAllRelationshipsScan",
+    "DirectedRelationshipIndexScan",
+    "UndirectedRelationshipIndexScan",
+)
+
+# Each repository query with representative parameters from Neo4jCreation.cypher
+PROFILED_QUERIES = [
+    ("get_exercises_by_muscle", ExercisesRepository.EXERCISES_BY_MUSCLE_QUERY,
+     {"muscle_name": "chest"}),
+    ("get_muscles_by_group", ExercisesRepository.MUSCLES_BY_GROUP_QUERY,
+     {"group_name": "push"}),
+    ("get_groups_by_distribution", ExercisesRepository.GROUPS_BY_DISTRIBUTION_QUERY,
+     {"distribution_name": "push, pull, legs"}),
+    ("get_exercises_by_muscles", ExercisesRepository.EXERCISES_BY_MUSCLES_QUERY,
+     {"names": ["chest", "triceps", "front delts", "delts"]}),
+    ("get_muscles_by_groups", ExercisesRepository.MUSCLES_BY_GROUPS_QUERY,
+     {"names": ["push", "pull", "legs"]}),
+    ("get_groups_by_distributions", ExercisesRepository.GROUPS_BY_DISTRIBUTIONS_QUERY,
+     {"names": ["push, pull, legs", "bro split"]}),
+]
+
+
+def walk_plan(plan: dict):
+    """
+    Yields every operator of a profiled plan, depth first.
+
+    :param plan: The profile dictionary returned in the result summary.
+    """
+    yield plan
+    for child in plan.get("children", []):
+        yield from walk_plan(child)
+
+
+def profile_query(session, query: str, parameters: dict):
+    """
+    Runs a query with PROFILE and summarizes its plan.
+
+    :param session: An open Neo4j session.
+    :param query: The Cypher query to profile.
+    :param parameters: The query parameters.
+    :return: A tuple (db_hits, rows, scan_operators).
+    """
+    summary = session.run(f"PROFILE {query}", parameters).consume()
+    operators = list(walk_plan(summary.profile))
+    db_hits = sum(operator.get("dbHits", 0) for operator in operators)
+    rows = summary.profile.get("rows", 0)
+    scans = [operator["operatorType"] for operator in operators
+             if operator.get("operatorType", "").split("@")[0] in SCAN_OPERATORS]
+    return db_hits, rows, scans
+
+
+def main():
+    """
+    Profiles every ExercisesRepository query against the configured Neo4j instance.
+    Exits with a non-zero status if a query scans a label or exceeds --max-db-hits.
+    """
+    parser = argparse.ArgumentParser(description="Report db hits for the ExercisesRepository queries.")
+    parser.add_argument("--max-db-hits", type=int, default=None,
+                        help="Fail if any query needs more db hits than this.")
+    args = parser.parse_args()
+
+    config = Neo4jConfig()
+    failures = []
+    try:
+        with config.get_driver().session() as session:
+            print(f"{'query':<30} {'db hits':>8} {'rows':>6}  scans")
+            for name, query, parameters in PROFILED_QUERIES:
+                db_hits, rows, scans = profile_query(session, query, parameters)
+                print(f"{name:<30} {db_hits:>8} {rows:>6}  {', '.join(scans) or '-'}")
+                if scans:
+                    failures.append(f"{name} uses {', '.join(scans)}")
+                if args.max_db_hits is not None and db_hits > args.max_db_hits:
+                    failures.append(f"{name} needs {db_hits} db hits (max {args.max_db_hits})")
+    finally:
+        config.close()
+
+    for failure in failures:
+        print(f"Plan regression: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
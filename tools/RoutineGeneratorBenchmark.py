@@ -0,0 +1,274 @@
+import argparse
+import cProfile
+import pstats
+import random
+import timeit
+import tracemalloc
+
+from services.RoutineGeneratorService import RoutineGenerator
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+# Range of direct exercises per muscle; the seed catalog has up to 6 (chest), and going
+# past 4 exercises the [:4] slice and multi-exercise set splitting in generate_routines
+DEFAULT_EXERCISES_PER_MUSCLE = (1, 8)
+
+# Distributions of the synthetic catalog: groups (days) used and share of the muscles covered
+DISTRIBUTIONS = {
+    "full body": (1, 1.0),
+    "push, pull, legs": (3, 0.5),
+    "bro split": (5, 0.2),
+}
+
+
+class InMemoryExercisesRepository:
+    """
+    ExercisesRepository replacement backed by dictionaries instead of Neo4j.
+    """
+
+    def __init__(self, groups_by_distribution: dict, muscles_by_group: dict, exercises_by_muscle: dict):
+        """
+        Initialize with the catalog relationships.
+
+        :param groups_by_distribution: Group names for each distribution name.
+        :param muscles_by_group: Muscle names for each group name.
+        :param exercises_by_muscle: Exercise names for each muscle name.
+        """
+        self.groups_by_distribution = groups_by_distribution
+        self.muscles_by_group = muscles_by_group
+        self.exercises_by_muscle = exercises_by_muscle
+
+    def get_exercises_by_muscle(self, muscle_name: str):
+        """
+        Retrieves exercises that work a specific muscle.
+
+        :param muscle_name: The name of the muscle.
+        :return: A list of exercises related to the muscle.
+        """
+        return list(self.exercises_by_muscle.get(muscle_name, []))
+
+    def get_muscles_by_group(self, group_name: str):
+        """
+        Retrieves all muscles for a specific group.
+
+        :param group_name: The name of the group.
+        :return: A list of muscles associated with the group.
+        """
+        return list(self.muscles_by_group.get(group_name, []))
+
+    def get_groups_by_distribution(self, distribution_name: str):
+        """
+        Retrieves all groups for a specific distribution.
+
+        :param distribution_name: The name of the distribution.
+        :return: A list of groups associated with the distribution.
+        """
+        return list(self.groups_by_distribution.get(distribution_name, []))
+
+    def get_exercises_by_muscles(self, muscle_names: list):
+        """
+        Retrieves exercises for several muscles at once.
+
+        :param muscle_names: The names of the muscles.
+        :return: A dictionary mapping each muscle name to its list of exercises.
+        """
+        return {name: list(self.exercises_by_muscle.get(name, [])) for name in muscle_names}
+
+    def get_muscles_by_groups(self, group_names: list):
+        """
+        Retrieves the muscles for several groups at once.
+
+        :param group_names: The names of the groups.
+        :return: A dictionary mapping each group name to its list of muscles.
+        """
+        return {name: list(self.muscles_by_group.get(name, [])) for name in group_names}
+
+
+class InMemoryVolumesRepository:
+    """
+    VolumesRepository replacement backed by a dictionary instead of PostgreSQL.
+    """
+
+    def __init__(self, volumes: dict):
+        """
+        Initialize with the volume data.
+
+        :param volumes: Volume dictionaries for each muscle name.
+        """
+        self.volumes = volumes
+
+    def get_volume_by_muscle_name(self, muscle_name: str):
+        """
+        Retrieves volume information for the specified muscle.
+
+        :param muscle_name: The name of the muscle.
+        :return: A dictionary containing volume data for the muscle, or None.
+        """
+        volume = self.volumes.get(muscle_name)
+        return dict(volume) if volume else None
+
+
+class InMemoryRepositoryFactory:
+    """
+    Factory handing the in-memory repositories to RoutineGenerator in place of
+    both the PostgreSQL and the Neo4j factories.
+    """
+
+    def __init__(self, exercises_repository: InMemoryExercisesRepository,
+                 volumes_repository: InMemoryVolumesRepository):
+        """
+        Initialize with the repositories to hand out.
+
+        :param exercises_repository: The in-memory exercises repository.
+        :param volumes_repository: The in-memory volumes repository.
+        """
+        self.exercises_repository = exercises_repository
+        self.volumes_repository = volumes_repository
+
+    def create_exercises_repository(self):
+        """
+        Returns the in-memory exercises repository.
+        """
+        return self.exercises_repository
+
+    def create_volumes_repository(self):
+        """
+        Returns the in-memory volumes repository.
+        """
+        return self.volumes_repository
+
+
+def build_catalog(size: int, seed: int = 0, exercises_per_muscle: tuple = DEFAULT_EXERCISES_PER_MUSCLE):
+    """
+    Builds a synthetic catalog with `size` muscles and `size` exercises.
+    Each muscle is worked directly by a random number of exercises within
+    `exercises_per_muscle`, and each distribution splits its share of the
+    muscles (see DISTRIBUTIONS) across its groups.
+
+    :param size: Number of muscles and of exercises.
+    :param seed: Seed for the random catalog layout.
+    :param exercises_per_muscle: Inclusive (min, max) exercises per muscle.
+    :return: An InMemoryRepositoryFactory serving the catalog.
+    """
+    rng = random.Random(seed)
+    muscles = [f"muscle {i}" for i in range(size)]
+    exercises = [f"exercise {i}" for i in range(size)]
+
+    low, high = exercises_per_muscle
+    exercises_by_muscle = {
+        muscle: rng.sample(exercises, min(size, rng.randint(low, high)))
+        for muscle in muscles
+    }
+
+    groups_by_distribution = {}
+    muscles_by_group = {}
+    for distribution, (group_count, coverage) in DISTRIBUTIONS.items():
+        covered = rng.sample(muscles, min(size, max(group_count, round(size * coverage))))
+        groups = [f"{distribution} day {day + 1}" for day in range(group_count)]
+        groups_by_distribution[distribution] = groups
+        for day, group in enumerate(groups):
+            muscles_by_group[group] = covered[day::group_count]
+
+    volumes = {
+        muscle: {"muscle_group": muscle, "mv": 0, "mev": rng.randint(2, 12), "mav": 0,
+                 "mrv": 0, "frequency_per_week": 3, "reps": 12, "rir": 2}
+        for muscle in muscles
+    }
+
+    return InMemoryRepositoryFactory(
+        InMemoryExercisesRepository(groups_by_distribution, muscles_by_group, exercises_by_muscle),
+        InMemoryVolumesRepository(volumes),
+    )
+
+
+def generate_batch(generator: RoutineGenerator):
+    """
+    Generates the routines of every distribution once.
+
+    :return: The routines of each distribution.
+    """
+    return [generator.generate_routines(distribution) for distribution in DISTRIBUTIONS]
+
+
+def time_call(function, repeat: int):
+    """
+    Times a call with timeit, calibrating the loop count automatically.
+
+    :return: The best time per call in milliseconds.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1000
+
+
+def measure_allocations(function):
+    """
+    Runs a call under tracemalloc. tracemalloc only sees live blocks, so the
+    temporaries freed during the call (slices, shuffles, volume dicts) show up
+    in the peak rather than in the block count.
+
+    :return: A tuple (blocks retained by the returned routines, peak KiB during the call).
+    """
+    # Leave out the traces of the snapshots themselves
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<unknown>")]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(filters)
+    tracemalloc.reset_peak()
+    result = function()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot().filter_traces(filters)
+    tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return blocks, peak / 1024
+
+
+def main():
+    """
+    Benchmarks RoutineGenerator.generate_routines on synthetic catalogs of growing size.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark RoutineGenerator on synthetic catalogs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Catalog sizes (muscles and exercises) to benchmark.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions; the best one is kept.")
+    parser.add_argument("--exercises-per-muscle", type=int, nargs=2, metavar=("MIN", "MAX"),
+                        default=DEFAULT_EXERCISES_PER_MUSCLE, help="Range of exercises working each muscle.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for catalogs and exercise shuffling.")
+    parser.add_argument("--tracemalloc", action="store_true", help="Report retained blocks and peak memory of each call.")
+    parser.add_argument("--profile", action="store_true", help="Print a cProfile of one batch at the largest size.")
+    args = parser.parse_args()
+    if args.exercises_per_muscle[0] > args.exercises_per_muscle[1]:
+        parser.error("--exercises-per-muscle MIN must not be greater than MAX")
+
+    random.seed(args.seed)
+    header = f"{'size':>6} {'distribution':<18} {'ms/call':>10}"
+    if args.tracemalloc:
+        header += f" {'retained':>8} {'peak KiB':>9}"
+    print(header)
+
+    generators = {}
+    for size in args.sizes:
+        factory = build_catalog(size, args.seed, tuple(args.exercises_per_muscle))
+        generator = RoutineGenerator(factory, factory)
+        generators[size] = generator
+
+        cases = [(distribution, lambda d=distribution: generator.generate_routines(d))
+                 for distribution in DISTRIBUTIONS]
+        cases.append(("batch", lambda: generate_batch(generator)))
+        for name, function in cases:
+            line = f"{size:>6} {name:<18} {time_call(function, args.repeat):>10.3f}"
+            if args.tracemalloc:
+                blocks, peak = measure_allocations(function)
+                line += f" {blocks:>8} {peak:>9.1f}"
+            print(line)
+
+    if args.profile:
+        size = max(args.sizes)
+        print(f"\ncProfile of one batch at size {size}:")
+        profiler = cProfile.Profile()
+        profiler.runcall(generate_batch, generators[size])
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+
+if __name__ == "__main__":
+    main()